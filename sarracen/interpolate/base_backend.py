@@ -1,7 +1,8 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from numba.core.registry import CPUDispatcher
 from numpy import ndarray, zeros
+import numpy as np
 
 
 class BaseBackend:
@@ -10,9 +11,10 @@ class BaseBackend:
     @staticmethod
     def interpolate_2d_render(x: ndarray, y: ndarray, weight: ndarray, h: ndarray, weight_function: CPUDispatcher,
                               kernel_radius: float, x_pixels: int, y_pixels: int, x_min: float, x_max: float,
-                              y_min: float, y_max: float, exact: bool) -> ndarray:
+                              y_min: float, y_max: float, exact: bool, dtype: np.dtype = np.float64,
+                              out: Optional[ndarray] = None) -> ndarray:
         """ Interpolate 2D particle data to a 2D grid of pixels."""
-        return zeros((y_pixels, x_pixels))
+        return zeros((y_pixels, x_pixels), dtype=dtype)
 
     @staticmethod
     def interpolate_2d_render_vec(x: ndarray, y: ndarray, weight_x: ndarray, weight_y: ndarray, h: ndarray,
@@ -24,9 +26,10 @@ class BaseBackend:
 
     @staticmethod
     def interpolate_2d_line(x: ndarray, y: ndarray, weight: ndarray, h: ndarray, weight_function: CPUDispatcher,
-                             kernel_radius: float, pixels: int, x1: float, x2: float, y1: float, y2: float) -> ndarray:
+                             kernel_radius: float, pixels: int, x1: float, x2: float, y1: float, y2: float,
+                             dtype: np.dtype = np.float64, out: Optional[ndarray] = None) -> ndarray:
         """ Interpolate 2D particle data to a 1D cross-sectional line. """
-        return zeros(pixels)
+        return zeros(pixels, dtype=dtype)
 
     @staticmethod
     def interpolate_3d_line(x: ndarray, y: ndarray, z: ndarray, weight: ndarray, h: ndarray,
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from numba import njit, prange, get_num_threads
 from numba.core.registry import CPUDispatcher
@@ -14,11 +14,16 @@ class CPUBackend(BaseBackend):
     @staticmethod
     def interpolate_2d_render(x: ndarray, y: ndarray, weight: ndarray, h: ndarray, weight_function: CPUDispatcher,
                               kernel_radius: float, x_pixels: int, y_pixels: int, x_min: float, x_max: float,
-                              y_min: float, y_max: float, exact: bool) -> ndarray:
+                              y_min: float, y_max: float, exact: bool, dtype: np.dtype = np.float64,
+                              out: Optional[ndarray] = None) -> ndarray:
         if exact:
-            return CPUBackend._exact_2d_render(x, y, weight, h, x_pixels, y_pixels, x_min, x_max, y_min, y_max)
+            image = CPUBackend._exact_2d_render(x, y, weight, h, x_pixels, y_pixels, x_min, x_max, y_min, y_max)
+            if out is None:
+                return image.astype(dtype, copy=False)
+            out[:] = image
+            return out
         return CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h, weight_function, kernel_radius,
-                                   x_pixels, y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   x_pixels, y_pixels, x_min, x_max, y_min, y_max, 2, dtype, out)
 
     @staticmethod
     def interpolate_2d_render_vec(x: ndarray, y: ndarray, weight_x: ndarray, weight_y: ndarray, h: ndarray,
@@ -35,8 +40,10 @@ class CPUBackend(BaseBackend):
 
     @staticmethod
     def interpolate_2d_cross(x: ndarray, y: ndarray, weight: ndarray, h: ndarray, weight_function: CPUDispatcher,
-                             kernel_radius: float, pixels: int, x1: float, x2: float, y1: float, y2: float) -> ndarray:
-        return CPUBackend._fast_2d_cross_cpu(x, y, weight, h, weight_function, kernel_radius, pixels, x1, x2, y1, y2)
+                             kernel_radius: float, pixels: int, x1: float, x2: float, y1: float, y2: float,
+                             dtype: np.dtype = np.float64, out: Optional[ndarray] = None) -> ndarray:
+        return CPUBackend._fast_2d_cross_cpu(x, y, weight, h, weight_function, kernel_radius, pixels, x1, x2, y1, y2,
+                                             dtype, out)
 
     @staticmethod
     def interpolate_3d_line(x: ndarray, y: ndarray, z: ndarray, weight: ndarray, h: ndarray,
@@ -92,10 +99,26 @@ class CPUBackend(BaseBackend):
         image = np.zeros((z_pixels, y_pixels, x_pixels))
         pixwidthz = (z_max - z_min) / z_pixels
 
+        if x.size == 0:
+            return image
+
+        # sort particles along the z-axis, so that each slice only needs to consider the slab of
+        # particles within one (maximum) smoothing radius of it.
+        order = np.argsort(z)
+        x, y, z, weight, h = x[order], y[order], z[order], weight[order], h[order]
+        reach = kernel_radius * h.max()
+
         for z_i in np.arange(z_pixels):
             z_val = z_min + (z_i + 0.5) * pixwidthz
-            image[z_i] = CPUBackend._fast_2d(x, y, z, z_val, weight, h, weight_function, kernel_radius, x_pixels,
-                                             y_pixels, x_min, x_max, y_min, y_max, 3)
+            start = np.searchsorted(z, z_val - reach, side='left')
+            end = np.searchsorted(z, z_val + reach, side='right')
+            if start == end:
+                continue
+
+            # each slice is a contiguous view of the grid, which is interpolated into directly.
+            CPUBackend._fast_2d(x[start:end], y[start:end], z[start:end], z_val, weight[start:end], h[start:end],
+                                weight_function, kernel_radius, x_pixels, y_pixels, x_min, x_max, y_min, y_max, 3,
+                                out=image[z_i])
 
         return image
 
@@ -105,18 +128,53 @@ class CPUBackend(BaseBackend):
     @staticmethod
     @njit(parallel=True, fastmath=True)
     def _fast_2d(x_data, y_data, z_data, z_slice, w_data, h_data, weight_function, kernel_radius, x_pixels, y_pixels,
-                 x_min, x_max, y_min, y_max, n_dims):
-        output = np.zeros((y_pixels, x_pixels))
+                 x_min, x_max, y_min, y_max, n_dims, dtype=np.float64, out=None):
+        if out is None:
+            output = np.zeros((y_pixels, x_pixels), dtype=dtype)
+        else:
+            output = out
+            output[:] = 0
         pixwidthx = (x_max - x_min) / x_pixels
         pixwidthy = (y_max - y_min) / y_pixels
+        inv_pixwidthx = 1 / pixwidthx
+        inv_pixwidthy = 1 / pixwidthy
         if not n_dims == 2:
             dz = np.float64(z_slice) - z_data
         else:
             dz = np.zeros(x_data.size)
 
-        term = w_data / h_data ** n_dims
-
-        output_local = np.zeros((get_num_threads(), y_pixels, x_pixels))
+        # positions are kept in double precision, only the accumulated contributions use `dtype`.
+        term = (w_data / h_data ** n_dims).astype(dtype)
+        inv_h2 = 1 / h_data ** 2
+        radius2 = kernel_radius ** 2
+
+        # determine maximum and minimum pixels that each particle contributes to, for all particles at once.
+        # bounds are rounded to the nearest pixel boundary. pixels which are only included or excluded by the
+        # rounding of exact halves lie outside the kernel, so ties may be rounded in either direction.
+        reach = kernel_radius * h_data
+        ipixmin = np.maximum(np.floor((x_data - reach - x_min) * inv_pixwidthx + 0.5), 0).astype(np.int64)
+        jpixmin = np.maximum(np.floor((y_data - reach - y_min) * inv_pixwidthy + 0.5), 0).astype(np.int64)
+        ipixmax = np.minimum(np.floor((x_data + reach - x_min) * inv_pixwidthx + 0.5), x_pixels).astype(np.int64)
+        jpixmax = np.minimum(np.floor((y_data + reach - y_min) * inv_pixwidthy + 0.5), y_pixels).astype(np.int64)
+
+        # particles which do not contribute to any pixel are given an empty range.
+        culled = (np.abs(dz) >= reach) | (ipixmax <= ipixmin) | (jpixmax <= jpixmin)
+        ipixmin[culled] = 0
+        ipixmax[culled] = 0
+        jpixmin[culled] = 0
+        jpixmax[culled] = 0
+
+        # the image is split into square tiles, which each fit in cache during accumulation.
+        tile_size = 128
+        x_tiles = (x_pixels + tile_size - 1) // tile_size
+        y_tiles = (y_pixels + tile_size - 1) // tile_size
+        n_tiles = x_tiles * y_tiles
+
+        # pixel centres do not depend on the particle, so they are calculated once for the whole image
+        x_centers = x_min + (np.arange(x_pixels) + 0.5) * pixwidthx
+        y_centers = y_min + (np.arange(y_pixels) + 0.5) * pixwidthy
+
+        output_local = np.zeros((get_num_threads(), y_pixels, x_pixels), dtype=dtype)
 
         # thread safety: each thread has its own grid, which are combined after interpolation
         for thread in prange(get_num_threads()):
@@ -124,46 +182,81 @@ class CPUBackend(BaseBackend):
             range_start = int(thread * block_size)
             range_end = int((thread + 1) * block_size)
 
-            # iterate through the indexes of non-filtered particles
+            # the particles of this thread overlapping each tile are stored contiguously in tile_particles,
+            # with tile t owning the range tile_start[t]:tile_start[t + 1].
+            tile_start = np.zeros(n_tiles + 1, dtype=np.int64)
             for i in range(range_start, range_end):
-                if np.abs(dz[i]) >= kernel_radius * h_data[i]:
-                    continue
-
-                # determine maximum and minimum pixels that this particle contributes to
-                ipixmin = int(np.rint((x_data[i] - kernel_radius * h_data[i] - x_min) / pixwidthx))
-                jpixmin = int(np.rint((y_data[i] - kernel_radius * h_data[i] - y_min) / pixwidthy))
-                ipixmax = int(np.rint((x_data[i] + kernel_radius * h_data[i] - x_min) / pixwidthx))
-                jpixmax = int(np.rint((y_data[i] + kernel_radius * h_data[i] - y_min) / pixwidthy))
+                for y_tile in range(jpixmin[i] // tile_size, (jpixmax[i] - 1) // tile_size + 1):
+                    for x_tile in range(ipixmin[i] // tile_size, (ipixmax[i] - 1) // tile_size + 1):
+                        tile_start[y_tile * x_tiles + x_tile + 1] += 1
+            tile_start = np.cumsum(tile_start)
 
-                if ipixmax < 0 or ipixmin > x_pixels or jpixmax < 0 or jpixmin > y_pixels:
+            tile_particles = np.empty(tile_start[-1], dtype=np.int64)
+            tile_fill = tile_start[:-1].copy()
+            for i in range(range_start, range_end):
+                for y_tile in range(jpixmin[i] // tile_size, (jpixmax[i] - 1) // tile_size + 1):
+                    for x_tile in range(ipixmin[i] // tile_size, (ipixmax[i] - 1) // tile_size + 1):
+                        tile = y_tile * x_tiles + x_tile
+                        tile_particles[tile_fill[tile]] = i
+                        tile_fill[tile] += 1
+
+            # scratch buffers for a single tile, reused by every tile of this thread
+            tile_buffer = np.empty(tile_size * tile_size, dtype=dtype)
+            dx2i = np.empty(tile_size)
+
+            for tile in range(n_tiles):
+                if tile_start[tile] == tile_start[tile + 1]:
                     continue
-                if ipixmin < 0:
-                    ipixmin = 0
-                if ipixmax > x_pixels:
-                    ipixmax = x_pixels
-                if jpixmin < 0:
-                    jpixmin = 0
-                if jpixmax > y_pixels:
-                    jpixmax = y_pixels
-
-                # precalculate differences in the x-direction (optimization)
-                dx2i = ((x_min + (np.arange(ipixmin, ipixmax) + 0.5) * pixwidthx - x_data[i]) ** 2) \
-                       * (1 / (h_data[i] ** 2)) + ((dz[i] ** 2) * (1 / h_data[i] ** 2))
-
-                # determine differences in the y-direction
-                ypix = y_min + (np.arange(jpixmin, jpixmax) + 0.5) * pixwidthy
-                dy = ypix - y_data[i]
-                dy2 = dy * dy * (1 / (h_data[i] ** 2))
-
-                # calculate contributions at pixels i, j due to particle at x, y
-                q2 = dx2i + dy2.reshape(len(dy2), 1)
-
-                for jpix in range(jpixmax - jpixmin):
-                    for ipix in range(ipixmax - ipixmin):
-                        if np.sqrt(q2[jpix][ipix]) > kernel_radius:
-                            continue
-                        wab = weight_function(np.sqrt(q2[jpix][ipix]), n_dims)
-                        output_local[thread][jpix + jpixmin, ipix + ipixmin] += term[i] * wab
+
+                tile_imin = (tile % x_tiles) * tile_size
+                tile_jmin = (tile // x_tiles) * tile_size
+                tile_imax = min(tile_imin + tile_size, x_pixels)
+                tile_jmax = min(tile_jmin + tile_size, y_pixels)
+
+                tile_height = tile_jmax - tile_jmin
+                tile_width = tile_imax - tile_imin
+                tile_image = tile_buffer[:tile_height * tile_width].reshape((tile_height, tile_width))
+                tile_image[:] = 0
+                tile_x_centers = x_centers[tile_imin:tile_imax]
+                tile_y_centers = y_centers[tile_jmin:tile_jmax]
+
+                for k in range(tile_start[tile], tile_start[tile + 1]):
+                    i = tile_particles[k]
+
+                    # the part of this particle's pixel range that lies within the tile, relative to the tile
+                    # origin. indices that are provably non-negative let numba drop its wraparound handling,
+                    # so that the inner loop can be vectorized.
+                    imin = max(ipixmin[i] - tile_imin, 0)
+                    imax = min(ipixmax[i], tile_imax) - tile_imin
+                    jmin = max(jpixmin[i] - tile_jmin, 0)
+                    jmax = min(jpixmax[i], tile_jmax) - tile_jmin
+
+                    # per-particle values, read once outside the pixel loops
+                    xi, yi, hi21, termi = x_data[i], y_data[i], inv_h2[i], term[i]
+                    dz2 = dz[i] ** 2 * hi21
+
+                    # precalculate differences in the x-direction (optimization)
+                    for ipix in range(imin, imax):
+                        dx2i[ipix] = (tile_x_centers[ipix] - xi) ** 2 * hi21 + dz2
+
+                    # calculate contributions at pixels i, j due to particle at x, y
+                    for jj in range(jmax - jmin):
+                        jpix = jj + jmin
+                        dy = tile_y_centers[jpix] - yi
+                        dy2 = dy * dy * hi21
+
+                        for ii in range(imax - imin):
+                            ipix = ii + imin
+                            q2 = dx2i[ipix] + dy2
+
+                            # compare against the squared radius, so that the square root is only taken for
+                            # pixels within the kernel.
+                            if q2 > radius2:
+                                continue
+                            wab = weight_function(np.sqrt(q2), n_dims)
+                            tile_image[jpix, ipix] += termi * wab
+
+                output_local[thread, tile_jmin:tile_jmax, tile_imin:tile_imax] += tile_image
 
         for i in range(get_num_threads()):
             output += output_local[i]
@@ -196,14 +289,10 @@ class CPUBackend(BaseBackend):
 
                 if ipixmax < 0 or ipixmin >= x_pixels or jpixmax < 0 or jpixmin >= y_pixels:
                     continue
-                if ipixmin < 0:
-                    ipixmin = 0
-                if ipixmax > x_pixels:
-                    ipixmax = x_pixels
-                if jpixmin < 0:
-                    jpixmin = 0
-                if jpixmax > y_pixels:
-                    jpixmax = y_pixels
+                ipixmin = max(ipixmin, 0)
+                ipixmax = min(ipixmax, x_pixels)
+                jpixmin = max(jpixmin, 0)
+                jpixmax = min(jpixmax, y_pixels)
 
                 denom = 1 / np.abs(pixwidthx * pixwidthy) * h_data[i] ** 2
 
@@ -289,7 +378,8 @@ class CPUBackend(BaseBackend):
     # Underlying CPU numba-compiled code for 2D->1D cross-sections.
     @staticmethod
     @njit(parallel=True, fastmath=True)
-    def _fast_2d_cross_cpu(x_data, y_data, w_data, h_data, weight_function, kernel_radius, pixels, x1, x2, y1, y2):
+    def _fast_2d_cross_cpu(x_data, y_data, w_data, h_data, weight_function, kernel_radius, pixels, x1, x2, y1, y2,
+                           dtype=np.float64, out=None):
         # determine the slope of the cross-section line
         gradient = 0
         if not x2 - x1 == 0:
@@ -301,8 +391,6 @@ class CPUBackend(BaseBackend):
         pixwidth = xlength / pixels
         xpixwidth = (x2 - x1) / pixels
 
-        term = w_data / h_data ** 2
-
         # the intersections between the line and a particle's 'smoothing circle' are
         # found by solving a quadratic equation with the below values of a, b, and c.
         # if the determinant is negative, the particle does not contribute to the
@@ -312,16 +400,17 @@ class CPUBackend(BaseBackend):
         cc = x_data ** 2 + y_data ** 2 - 2 * yint * y_data + yint ** 2 - (kernel_radius * h_data) ** 2
         det = bb ** 2 - 4 * aa * cc
 
-        # create a filter for particles that do not contribute to the cross-section
+        # create a filter for particles that do not contribute to the cross-section. the square root is
+        # only taken for contributing particles, which avoids evaluating it on negative determinants.
         filter_det = det >= 0
-        det = np.sqrt(det)
         cc = None
 
-        output = np.zeros(pixels)
+        bb = bb[filter_det]
+        det = np.sqrt(det[filter_det])
 
         # the starting and ending x coordinates of the lines intersections with a particle's smoothing circle
-        xstart = ((-bb[filter_det] - det[filter_det]) / (2 * aa)).clip(a_min=x1, a_max=x2)
-        xend = ((-bb[filter_det] + det[filter_det]) / (2 * aa)).clip(a_min=x1, a_max=x2)
+        xstart = ((-bb - det) / (2 * aa)).clip(a_min=x1, a_max=x2)
+        xend = ((-bb + det) / (2 * aa)).clip(a_min=x1, a_max=x2)
         bb, det = None, None
 
         # the start and end distances which lie within a particle's smoothing circle.
@@ -329,34 +418,57 @@ class CPUBackend(BaseBackend):
         rend = np.sqrt((xend - x1) ** 2 + (((gradient * xend + yint) - y1) ** 2))
         xstart, xend = None, None
 
-        # the maximum and minimum pixels that each particle contributes to.
-        ipixmin = np.rint(rstart / pixwidth).clip(a_min=0, a_max=pixels)
-        ipixmax = np.rint(rend / pixwidth).clip(a_min=0, a_max=pixels)
+        # the maximum and minimum pixels that each particle contributes to, converted to integers once.
+        inv_pixwidth = 1 / pixwidth
+        ipixmin = np.rint(rstart * inv_pixwidth).astype(np.int64).clip(0, pixels)
+        ipixmax = np.rint(rend * inv_pixwidth).astype(np.int64).clip(0, pixels)
         rstart, rend = None, None
 
-        output_local = np.zeros((get_num_threads(), pixels))
+        # particles whose pixel range is empty are dropped as well. the data of the remaining particles is
+        # then gathered once into dense arrays, which are used from here on.
+        filter_pix = ipixmax > ipixmin
+        keep = np.nonzero(filter_det)[0][filter_pix]
+        ipixmin = ipixmin[filter_pix]
+        ipixmax = ipixmax[filter_pix]
+
+        x_filt = x_data[keep]
+        y_filt = y_data[keep]
+        inv_h2 = 1 / h_data[keep] ** 2
+        term = (w_data[keep] * inv_h2).astype(dtype)
+
+        if out is None:
+            output = np.zeros(pixels, dtype=dtype)
+        else:
+            output = out
+            output[:] = 0
+
+        output_local = np.zeros((get_num_threads(), pixels), dtype=dtype)
+
+        # positions of the pixel centres along the line, shared by all particles
+        x_centers = x1 + (np.arange(pixels) + 0.5) * xpixwidth
+        y_centers = gradient * x_centers + yint
 
         # thread safety: each thread has its own grid, which are combined after interpolation
         for thread in prange(get_num_threads()):
 
-            block_size = len(x_data[filter_det]) / get_num_threads()
-            range_start = thread * block_size
-            range_end = (thread + 1) * block_size
+            block_size = x_filt.size / get_num_threads()
+            range_start = int(thread * block_size)
+            range_end = int((thread + 1) * block_size)
 
             # iterate through the indices of all non-filtered particles
             for i in range(range_start, range_end):
                 # determine contributions to all affected pixels for this particle
-                xpix = x1 + (np.arange(int(ipixmin[i]), int(ipixmax[i])) + 0.5) * xpixwidth
-                ypix = gradient * xpix + yint
-                dy = ypix - y_data[filter_det][i]
-                dx = xpix - x_data[filter_det][i]
+                xi, yi, hi21, termi = x_filt[i], y_filt[i], inv_h2[i], term[i]
 
-                q2 = (dx * dx + dy * dy) * (1 / (h_data[filter_det][i] * h_data[filter_det][i]))
-                wab = weight_function(np.sqrt(q2), 2)
+                for ipix in range(ipixmin[i], ipixmax[i]):
+                    dy = y_centers[ipix] - yi
+                    dx = x_centers[ipix] - xi
 
-                # add contributions to output total
-                for ipix in range(int(ipixmax[i]) - int(ipixmin[i])):
-                    output_local[thread][ipix + int(ipixmin[i])] += term[filter_det][i] * wab[ipix]
+                    q2 = (dx * dx + dy * dy) * hi21
+                    wab = weight_function(np.sqrt(q2), 2)
+
+                    # add contributions to output total
+                    output_local[thread, ipix] += termi * wab
 
         for i in range(get_num_threads()):
             output += output_local[i]
@@ -377,36 +489,43 @@ class CPUBackend(BaseBackend):
         ux, uy, uz = dx / length, dy / length, dz / length
         term = w_data / h_data ** 3
 
+        # positions of the pixel centres along the line, shared by all particles
+        x_centers = x1 + (np.arange(pixels) + 0.5) * dx / pixels
+        y_centers = y1 + (np.arange(pixels) + 0.5) * dy / pixels
+        z_centers = z1 + (np.arange(pixels) + 0.5) * dz / pixels
+
         for thread in prange(get_num_threads()):
             block_size = x_data.size / get_num_threads()
             range_start = int(thread * block_size)
             range_end = int((thread + 1) * block_size)
 
             for i in range(range_start, range_end):
+                xi, yi, zi = x_data[i], y_data[i], z_data[i]
 
-                delta = (ux * (x1 - x_data[i]) + uy * (y1 - y_data[i]) + uz * (z1 - z_data[i])) ** 2 - ((x1 - x_data[i]) ** 2 + (y1 - y_data[i]) ** 2 + (z1 - z_data[i]) ** 2) + (kernel_radius * h_data[i]) ** 2
+                # projection of the particle's offset from the line start onto the line direction
+                proj = ux * (x1 - xi) + uy * (y1 - yi) + uz * (z1 - zi)
+                delta = proj ** 2 - ((x1 - xi) ** 2 + (y1 - yi) ** 2 + (z1 - zi) ** 2) + (kernel_radius * h_data[i]) ** 2
                 if delta < 0:
                     continue
 
-                d1 = -(ux * (x1 - x_data[i]) + uy * (y1 - y_data[i]) + uz * (z1 - z_data[i])) - np.sqrt(delta)
-                d2 = -(ux * (x1 - x_data[i]) + uy * (y1 - y_data[i]) + uz * (z1 - z_data[i])) + np.sqrt(delta)
+                d1 = -proj - np.sqrt(delta)
+                d2 = -proj + np.sqrt(delta)
 
                 pixmin = min(max(0, round((d1 / length) * pixels)), pixels)
                 pixmax = min(max(0, round((d2 / length) * pixels)), pixels)
 
-                xpix = x1 + (np.arange(pixmin, pixmax) + 0.5) * (x2 - x1) / pixels
-                ypix = y1 + (np.arange(pixmin, pixmax) + 0.5) * (y2 - y1) / pixels
-                zpix = z1 + (np.arange(pixmin, pixmax) + 0.5) * (z2 - z1) / pixels
-
-                xdiff = xpix - x_data[i]
-                ydiff = ypix - y_data[i]
-                zdiff = zpix - z_data[i]
+                # the weight function is evaluated per pixel, so that scalar-only weight functions
+                # (such as those of a TabulatedKernel) can be used.
+                hi21, termi = 1 / h_data[i] ** 2, term[i]
+                for ipix in range(pixmin, pixmax):
+                    xdiff = x_centers[ipix] - xi
+                    ydiff = y_centers[ipix] - yi
+                    zdiff = z_centers[ipix] - zi
 
-                q2 = (xdiff ** 2 + ydiff ** 2 + zdiff ** 2) * (1 / (h_data[i] ** 2))
-                wab = weight_function(np.sqrt(q2), 3)
+                    q2 = (xdiff ** 2 + ydiff ** 2 + zdiff ** 2) * hi21
+                    wab = weight_function(np.sqrt(q2), 3)
 
-                for ipix in range(pixmax - pixmin):
-                    output_local[thread][ipix + pixmin] += term[i] * wab[ipix]
+                    output_local[thread, ipix] += termi * wab
 
         output = np.zeros(pixels)
 
@@ -446,14 +565,10 @@ class CPUBackend(BaseBackend):
 
                 if ipixmax < 0 or ipixmin >= x_pixels or jpixmax < 0 or jpixmin >= y_pixels:
                     continue
-                if ipixmin < 0:
-                    ipixmin = 0
-                if ipixmax > x_pixels:
-                    ipixmax = x_pixels
-                if jpixmin < 0:
-                    jpixmin = 0
-                if jpixmax > y_pixels:
-                    jpixmax = y_pixels
+                ipixmin = max(ipixmin, 0)
+                ipixmax = min(ipixmax, x_pixels)
+                jpixmin = max(jpixmin, 0)
+                jpixmax = min(jpixmax, y_pixels)
 
                 for jpix in range(jpixmin, jpixmax):
                     ypix = y_min + (jpix + 0.5) * pixwidthy
@@ -1,5 +1,6 @@
 import math
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import numpy as np
 from numba import cuda
@@ -15,11 +16,16 @@ class GPUBackend(BaseBackend):
     @staticmethod
     def interpolate_2d_render(x: ndarray, y: ndarray, weight: ndarray, h: ndarray, weight_function: CPUDispatcher,
                               kernel_radius: float, x_pixels: int, y_pixels: int, x_min: float, x_max: float,
-                              y_min: float, y_max: float, exact: bool) -> ndarray:
+                              y_min: float, y_max: float, exact: bool, dtype: np.dtype = np.float64,
+                              out: Optional[ndarray] = None) -> ndarray:
         if exact:
-            return GPUBackend._exact_2d_render(x, y, weight, h, x_pixels, y_pixels, x_min, x_max, y_min, y_max)
+            image = GPUBackend._exact_2d_render(x, y, weight, h, x_pixels, y_pixels, x_min, x_max, y_min, y_max)
+            if out is None:
+                return image.astype(dtype, copy=False)
+            out[:] = image
+            return out
         return GPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h, weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   y_pixels, x_min, x_max, y_min, y_max, 2, dtype, out)
 
     @staticmethod
     def interpolate_2d_render_vec(x: ndarray, y: ndarray, weight_x: ndarray, weight_y: ndarray, h: ndarray,
@@ -36,8 +42,10 @@ class GPUBackend(BaseBackend):
 
     @staticmethod
     def interpolate_2d_cross(x: ndarray, y: ndarray, weight: ndarray, h: ndarray, weight_function: CPUDispatcher,
-                             kernel_radius: float, pixels: int, x1: float, x2: float, y1: float, y2: float) -> ndarray:
-        return GPUBackend._fast_2d_cross(x, y, weight, h, weight_function, kernel_radius, pixels, x1, x2, y1, y2)
+                             kernel_radius: float, pixels: int, x1: float, x2: float, y1: float, y2: float,
+                             dtype: np.dtype = np.float64, out: Optional[ndarray] = None) -> ndarray:
+        return GPUBackend._fast_2d_cross(x, y, weight, h, weight_function, kernel_radius, pixels, x1, x2, y1, y2,
+                                         dtype, out)
 
     @staticmethod
     def interpolate_3d_line(x: ndarray, y: ndarray, z: ndarray, weight: ndarray, h: ndarray,
@@ -93,19 +101,65 @@ class GPUBackend(BaseBackend):
         image = np.zeros((z_pixels, y_pixels, x_pixels))
         pixwidthz = (z_max - z_min) / z_pixels
 
+        if x.size == 0:
+            return image
+
+        # sort particles along the z-axis, so that each slice only needs to consider the slab of
+        # particles within one (maximum) smoothing radius of it.
+        order = np.argsort(z)
+        x, y, z, weight, h = x[order], y[order], z[order], weight[order], h[order]
+        reach = kernel_radius * h.max()
+
         # todo: this should be separated from _fast_2d to reduce the unnecessary transfer of data to the graphics card.
         for z_i in np.arange(z_pixels):
             z_val = z_min + (z_i + 0.5) * pixwidthz
-            image[z_i] = GPUBackend._fast_2d(x, y, z, z_val, weight, h, weight_function, kernel_radius, x_pixels,
-                                             y_pixels, x_min, x_max, y_min, y_max, 3)
+            start = np.searchsorted(z, z_val - reach, side='left')
+            end = np.searchsorted(z, z_val + reach, side='right')
+            if start == end:
+                continue
+
+            # each slice is a contiguous view of the grid, which is interpolated into directly.
+            GPUBackend._fast_2d(x[start:end], y[start:end], z[start:end], z_val, weight[start:end], h[start:end],
+                                weight_function, kernel_radius, x_pixels, y_pixels, x_min, x_max, y_min, y_max, 3,
+                                out=image[z_i])
 
         return image
 
-    # For the GPU, the numba code is compiled using a factory function approach. This is required
-    # since a CUDA numba kernel cannot easily take weight_function as an argument.
     @staticmethod
     def _fast_2d(x_data, y_data, z_data, z_slice, w_data, h_data, weight_function, kernel_radius, x_pixels, y_pixels,
-                 x_min, x_max, y_min, y_max, n_dims):
+                 x_min, x_max, y_min, y_max, n_dims, dtype=np.float64, out=None):
+        _2d_func = GPUBackend._fast_2d_kernel(weight_function)
+
+        threadsperblock = 32
+        blockspergrid = (x_data.size + (threadsperblock - 1)) // threadsperblock
+
+        # transfer relevant data to the GPU
+        d_x = cuda.to_device(x_data)
+        d_y = cuda.to_device(y_data)
+        d_z = cuda.to_device(z_data)
+        d_w = cuda.to_device(w_data)
+        d_h = cuda.to_device(h_data)
+        # CUDA kernels have no return values, so the image data must be
+        # allocated on the device beforehand.
+        if out is None:
+            out = np.zeros((y_pixels, x_pixels), dtype=dtype)
+        else:
+            out.fill(0)
+        d_image = cuda.to_device(out)
+
+        # execute the CUDA kernel.
+        _2d_func[blockspergrid, threadsperblock](z_slice, d_x, d_y, d_z, d_w, d_h, kernel_radius, x_pixels, y_pixels,
+                                                 x_min, x_max, y_min, y_max, n_dims, d_image)
+
+        return d_image.copy_to_host(out)
+
+    # For the GPU, the numba code is compiled using a factory function approach. This is required
+    # since a CUDA numba kernel cannot easily take weight_function as an argument. Kernels are cached
+    # per weight function, so that repeated interpolations (such as the slices of a 3D grid) reuse the
+    # compiled kernel rather than recompiling it on every call.
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _fast_2d_kernel(weight_function):
         # Underlying GPU numba-compiled code for interpolation to a 2D grid. Used in interpolation of 2D data,
         # and column integration / cross-sections of 3D data.
         @cuda.jit(fastmath=True)
@@ -134,14 +188,10 @@ class GPUBackend(BaseBackend):
 
                 if ipixmax < 0 or ipixmin > x_pixels or jpixmax < 0 or jpixmin > y_pixels:
                     return
-                if ipixmin < 0:
-                    ipixmin = 0
-                if ipixmax > x_pixels:
-                    ipixmax = x_pixels
-                if jpixmin < 0:
-                    jpixmin = 0
-                if jpixmax > y_pixels:
-                    jpixmax = y_pixels
+                ipixmin = max(ipixmin, 0)
+                ipixmax = min(ipixmax, x_pixels)
+                jpixmin = max(jpixmin, 0)
+                jpixmax = min(jpixmax, y_pixels)
 
                 # calculate contributions to all nearby pixels
                 for jpix in range(jpixmax - jpixmin):
@@ -159,32 +209,15 @@ class GPUBackend(BaseBackend):
                         dz2 = ((dz ** 2) * (1 / h_data[i] ** 2))
 
                         # calculate contributions at pixels i, j due to particle at x, y
-                        q = math.sqrt(dx2 + dy2 + dz2)
+                        q2 = dx2 + dy2 + dz2
 
-                        # add contribution to image
-                        if q < kernel_radius:
+                        # add contribution to image. the square root is only taken within the kernel.
+                        if q2 < kernel_radius * kernel_radius:
                             # atomic add protects the summation against race conditions.
-                            wab = weight_function(q, n_dims)
+                            wab = weight_function(math.sqrt(q2), n_dims)
                             cuda.atomic.add(image, (jpix + jpixmin, ipix + ipixmin), term * wab)
 
-        threadsperblock = 32
-        blockspergrid = (x_data.size + (threadsperblock - 1)) // threadsperblock
-
-        # transfer relevant data to the GPU
-        d_x = cuda.to_device(x_data)
-        d_y = cuda.to_device(y_data)
-        d_z = cuda.to_device(z_data)
-        d_w = cuda.to_device(w_data)
-        d_h = cuda.to_device(h_data)
-        # CUDA kernels have no return values, so the image data must be
-        # allocated on the device beforehand.
-        d_image = cuda.to_device(np.zeros((y_pixels, x_pixels)))
-
-        # execute the newly compiled CUDA kernel.
-        _2d_func[blockspergrid, threadsperblock](z_slice, d_x, d_y, d_z, d_w, d_h, kernel_radius, x_pixels, y_pixels,
-                                                 x_min, x_max, y_min, y_max, n_dims, d_image)
-
-        return d_image.copy_to_host()
+        return _2d_func
 
     # Underlying CPU numba-compiled code for exact interpolation of 2D data to a 2D grid.
     @staticmethod
@@ -208,14 +241,10 @@ class GPUBackend(BaseBackend):
 
                 if ipixmax < 0 or ipixmin >= x_pixels or jpixmax < 0 or jpixmin >= y_pixels:
                     return
-                if ipixmin < 0:
-                    ipixmin = 0
-                if ipixmax > x_pixels:
-                    ipixmax = x_pixels
-                if jpixmin < 0:
-                    jpixmin = 0
-                if jpixmax > y_pixels:
-                    jpixmax = y_pixels
+                ipixmin = max(ipixmin, 0)
+                ipixmax = min(ipixmax, x_pixels)
+                jpixmin = max(jpixmin, 0)
+                jpixmax = min(jpixmax, y_pixels)
 
                 denom = 1 / abs(pixwidthx * pixwidthy) * h_data[i] ** 2
 
@@ -310,7 +339,8 @@ class GPUBackend(BaseBackend):
     # For the GPU, the numba code is compiled using a factory function approach. This is required
     # since a CUDA numba kernel cannot easily take weight_function as an argument.
     @staticmethod
-    def _fast_2d_cross(x_data, y_data, w_data, h_data, weight_function, kernel_radius, pixels, x1, x2, y1, y2):
+    def _fast_2d_cross(x_data, y_data, w_data, h_data, weight_function, kernel_radius, pixels, x1, x2, y1, y2,
+                       dtype=np.float64, out=None):
         # determine the slope of the cross-section line
         gradient = 0
         if not x2 - x1 == 0:
@@ -382,12 +412,16 @@ class GPUBackend(BaseBackend):
 
         # CUDA kernels have no return values, so the image data must be
         # allocated on the device beforehand.
-        d_image = cuda.to_device(np.zeros(pixels))
+        if out is None:
+            out = np.zeros(pixels, dtype=dtype)
+        else:
+            out.fill(0)
+        d_image = cuda.to_device(out)
 
         # execute the newly compiled GPU kernel
         _2d_func[blockspergrid, threadsperblock](d_x, d_y, d_w, d_h, kernel_radius, pixels, x1, x2, y1, y2, d_image)
 
-        return d_image.copy_to_host()
+        return d_image.copy_to_host(out)
 
     @staticmethod
     def _fast_3d_line(x_data, y_data, z_data, w_data, h_data, weight_function, kernel_radius, pixels, x1, x2, y1, y2,
@@ -478,14 +512,10 @@ class GPUBackend(BaseBackend):
 
                 if ipixmax < 0 or ipixmin >= x_pixels or jpixmax < 0 or jpixmin >= y_pixels:
                     return
-                if ipixmin < 0:
-                    ipixmin = 0
-                if ipixmax > x_pixels:
-                    ipixmax = x_pixels
-                if jpixmin < 0:
-                    jpixmin = 0
-                if jpixmax > y_pixels:
-                    jpixmax = y_pixels
+                ipixmin = max(ipixmin, 0)
+                ipixmax = min(ipixmax, x_pixels)
+                jpixmin = max(jpixmin, 0)
+                jpixmax = min(jpixmax, y_pixels)
 
                 for jpix in range(jpixmin, jpixmax):
                     ypix = y_min + (jpix + 0.5) * pixwidthy
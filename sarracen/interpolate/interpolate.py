@@ -8,7 +8,7 @@ from scipy.spatial.transform import Rotation
 from ..interpolate import BaseBackend, CPUBackend, GPUBackend
 from ..kernels import BaseKernel
 
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 import warnings
 
 
@@ -199,6 +199,56 @@ def _check_dimension(data, dim):
         raise TypeError(f"Dataset is not {dim}-dimensional.")
 
 
+def _check_dtype(dtype) -> type:
+    """
+    Verify that an output data type is supported by the interpolation backends.
+
+    Parameters
+    ----------
+    dtype: data-type
+        The output data type passed to the interpolation function, in any form accepted by `np.dtype`.
+
+    Returns
+    -------
+    type
+        The scalar type of `dtype`, either np.float32 or np.float64.
+
+    Raises
+    ------
+    ValueError
+        If `dtype` is not a 32-bit or 64-bit floating point type.
+    """
+    dtype = np.dtype(dtype).type
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"`dtype` must be np.float32 or np.float64, not {dtype.__name__}!")
+
+    return dtype
+
+
+def _check_output(out: np.ndarray, shape: Tuple[int, ...]):
+    """
+    Verify that a preallocated output array can hold the result of an interpolation.
+
+    Parameters
+    ----------
+    out: ndarray
+        The output array passed to the interpolation function.
+    shape: tuple of int
+        The shape of the interpolation result.
+
+    Raises
+    ------
+    ValueError
+        If `out` does not have shape `shape`, is not C-contiguous, or is not of type np.float32 or np.float64.
+    """
+    if out.shape != shape:
+        raise ValueError(f"`out` has shape {out.shape}, but the interpolation result has shape {shape}!")
+    if not out.flags.c_contiguous:
+        raise ValueError("`out` must be C-contiguous!")
+    if out.dtype.type not in (np.float32, np.float64):
+        raise ValueError(f"`out` must be of type np.float32 or np.float64, not {out.dtype.type.__name__}!")
+
+
 def _rotate_data(data, x, y, z, rotation, rot_origin):
     """
     Rotate vector data in a particle dataset.
@@ -291,13 +341,13 @@ def _rotate_xyz(data, x, y, z, rotation, rot_origin):
     rotated_x, rotated_y, rotated_z = _rotate_data(data, data.xcol, data.ycol, data.zcol, rotation, rot_origin)
     x_data = rotated_x if x == data.xcol else \
         rotated_y if x == data.ycol else \
-            rotated_z if x == data.zcol else data[x]
+            rotated_z if x == data.zcol else data[x].to_numpy()
     y_data = rotated_x if y == data.xcol else \
         rotated_y if y == data.ycol else \
-            rotated_z if y == data.zcol else data[y]
+            rotated_z if y == data.zcol else data[y].to_numpy()
     z_data = rotated_x if z == data.xcol else \
         rotated_y if z == data.ycol else \
-            rotated_z if z == data.zcol else data[z]
+            rotated_z if z == data.zcol else data[z].to_numpy()
 
     return x_data, y_data, z_data
 
@@ -316,7 +366,7 @@ def _get_density(data: 'SarracenDataFrame'):
         if not {data.hcol}.issubset(data.columns) or 'hfact' not in data.params:
             raise KeyError('Density cannot be derived from the columns in this SarracenDataFrame.')
 
-        return ((data.params['hfact'] / data[data.hcol]) ** (data.get_dim()) * _get_mass(data)).to_numpy()
+        return (data.params['hfact'] / data[data.hcol].to_numpy()) ** (data.get_dim()) * _get_mass(data)
 
     return data[data.rhocol].to_numpy()
 
@@ -370,7 +420,9 @@ def interpolate_2d(data: 'SarracenDataFrame',
                    backend: str = None,
                    dens_weight: bool = False,
                    normalize: bool = True,
-                   hmin: bool = False) -> np.ndarray:
+                   hmin: bool = False,
+                   dtype: np.dtype = np.float64,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Interpolate particle data across two directional axes to a 2D grid of pixels.
 
@@ -404,6 +456,15 @@ def interpolate_2d(data: 'SarracenDataFrame',
     hmin: bool
         If True, a minimum smoothing length of 0.5 * pixel size will be imposed. This ensures each particle
         contributes to at least one grid cell / pixel. Defaults to False (this may change in a future verison).
+    dtype: np.dtype
+        Data type of the output image. Particle positions are always handled in double precision, but
+        np.float32 may be used for the accumulated image to reduce memory traffic. Must be np.float32 or
+        np.float64, or an equivalent such as 'float32'. Defaults to np.float64. Ignored if `out` is given.
+    out: ndarray, optional
+        A preallocated array of shape (y_pixels, x_pixels) to store the output image in, instead of returning a
+        newly allocated image. Its previous contents are overwritten, and its type is used in place of `dtype`.
+        Only the returned image is preallocated: the backends still allocate their own working buffers (one image
+        per thread on the CPU), and `normalize` allocates a second image for the normalization.
 
     Returns
     -------
@@ -416,7 +477,9 @@ def interpolate_2d(data: 'SarracenDataFrame',
     ValueError
         If `x_pixels` or `y_pixels` are less than or equal to zero, or
         if the specified `x` and `y` minimum and maximum values result in an invalid region, or
-        if `data` is not 2-dimensional.
+        if `data` is not 2-dimensional, or
+        if `out` is not given and `dtype` is not np.float32 or np.float64, or
+        if `out` does not match the shape of the output, is not C-contiguous, or is not np.float32 or np.float64.
     KeyError
         If `target`, `x`, `y`, mass, density, or smoothing length columns do not
         exist in `data`.
@@ -428,24 +491,32 @@ def interpolate_2d(data: 'SarracenDataFrame',
     xlim, ylim = _default_bounds(data, x, y, xlim, ylim)
     x_pixels, y_pixels = _set_pixels(x_pixels, y_pixels, xlim, ylim)
     _check_boundaries(x_pixels, y_pixels, xlim, ylim)
+    if out is not None:
+        _check_output(out, (y_pixels, x_pixels))
+        dtype = out.dtype.type
+    else:
+        dtype = _check_dtype(dtype)
     w_data = _get_weight(data, target, dens_weight)
 
     kernel = kernel if kernel is not None else data.kernel
     backend = backend if backend is not None else data.backend
 
+    x_data = data[x].to_numpy()
+    y_data = data[y].to_numpy()
     h_data = _get_smoothing_lengths(data, hmin, x_pixels, y_pixels, xlim, ylim)
 
     grid = get_backend(backend). \
-           interpolate_2d_render(data[x].to_numpy(), data[y].to_numpy(), w_data, h_data, kernel.w,
-                              kernel.get_radius(), x_pixels, y_pixels, xlim[0], xlim[1], ylim[0], ylim[1], exact)
+           interpolate_2d_render(x_data, y_data, w_data, h_data, kernel.w,
+                              kernel.get_radius(), x_pixels, y_pixels, xlim[0], xlim[1], ylim[0], ylim[1], exact,
+                              dtype, out)
 
     if normalize:
-        w_norm = _get_weight(data, np.array([1] * len(w_data)), dens_weight)
+        w_norm = _get_weight(data, np.ones(len(w_data)), dens_weight)
         norm_grid = get_backend(backend). \
-                    interpolate_2d_render(data[x].to_numpy(), data[y].to_numpy(), w_norm, h_data,
+                    interpolate_2d_render(x_data, y_data, w_norm, h_data,
                                           kernel.w, kernel.get_radius(), x_pixels, y_pixels, xlim[0], xlim[1], ylim[0],
-                                          ylim[1], exact)
-        grid = np.nan_to_num(grid / norm_grid)
+                                          ylim[1], exact, dtype)
+        grid = np.nan_to_num(np.divide(grid, norm_grid, out=grid), copy=False)
 
     return grid
 
@@ -518,18 +589,20 @@ def interpolate_2d_vec(data: 'SarracenDataFrame', target_x: str, target_y: str,
     kernel = kernel if kernel is not None else data.kernel
     backend = backend if backend is not None else data.backend
 
+    x_data = data[x].to_numpy()
+    y_data = data[y].to_numpy()
     h_data = _get_smoothing_lengths(data, hmin, x_pixels, y_pixels, xlim, ylim)
 
     gridx, gridy = get_backend(backend).\
-           interpolate_2d_render_vec(data[x].to_numpy(), data[y].to_numpy(), wx_data, wy_data, h_data,
+           interpolate_2d_render_vec(x_data, y_data, wx_data, wy_data, h_data,
                                      kernel.w, kernel.get_radius(), x_pixels, y_pixels, xlim[0], xlim[1], ylim[0],
                                      ylim[1], exact)
 
     if normalize:
-        wx_norm = _get_weight(data, np.array([1] * len(wx_data)), dens_weight)
-        wy_norm = _get_weight(data, np.array([1] * len(wy_data)), dens_weight)
+        wx_norm = _get_weight(data, np.ones(len(wx_data)), dens_weight)
+        wy_norm = _get_weight(data, np.ones(len(wy_data)), dens_weight)
         norm_gridx, norm_gridy = get_backend(backend).\
-                                 interpolate_2d_render_vec(data[x].to_numpy(), data[y].to_numpy(), wx_norm, wy_norm,
+                                 interpolate_2d_render_vec(x_data, y_data, wx_norm, wy_norm,
                                                            h_data, kernel.w, kernel.get_radius(),
                                                            x_pixels, y_pixels, xlim[0], xlim[1], ylim[0], ylim[1],
                                                            exact)
@@ -549,7 +622,9 @@ def interpolate_2d_line(data: 'SarracenDataFrame',
                         backend: str = None,
                         dens_weight: bool = False,
                         normalize: bool = True,
-                        hmin: bool = False) -> np.ndarray:
+                        hmin: bool = False,
+                        dtype: np.dtype = np.float64,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Interpolate particle data across two directional axes to a 1D cross-section line.
 
@@ -580,6 +655,15 @@ def interpolate_2d_line(data: 'SarracenDataFrame',
     hmin: bool
         If True, a minimum smoothing length of 0.5 * pixel size will be imposed. This ensures each particle
         contributes to at least one grid cell / pixel. Defaults to False (this may change in a future verison).
+    dtype: np.dtype
+        Data type of the output line. Particle positions are always handled in double precision, but
+        np.float32 may be used for the accumulated output. Must be np.float32 or np.float64, or an equivalent
+        such as 'float32'. Defaults to np.float64. Ignored if `out` is given.
+    out: ndarray, optional
+        A preallocated array of shape (pixels,) to store the output in, instead of returning a newly allocated
+        array. Its previous contents are overwritten, and its type is used in place of `dtype`. Only the returned
+        array is preallocated: the backends still allocate their own working buffers (one array per thread on
+        the CPU), and `normalize` allocates a second array for the normalization.
 
     Returns
     -------
@@ -591,7 +675,9 @@ def interpolate_2d_line(data: 'SarracenDataFrame',
     ValueError
         If `x_pixels` or `y_pixels` are less than or equal to zero, or
         if the specified `xlim` and `ylim` values are all the same (indicating a zero-length cross-section), or
-        if `data` is not 2-dimensional.
+        if `data` is not 2-dimensional, or
+        if `out` is not given and `dtype` is not np.float32 or np.float64, or
+        if `out` does not match the shape of the output, is not C-contiguous, or is not np.float32 or np.float64.
     KeyError
         If `target`, `x`, `y`, mass, density, or smoothing length columns do not
         exist in `data`.
@@ -617,7 +703,14 @@ def interpolate_2d_line(data: 'SarracenDataFrame',
 
     if pixels <= 0:
         raise ValueError('pixcount must be greater than zero!')
+    if out is not None:
+        _check_output(out, (pixels,))
+        dtype = out.dtype.type
+    else:
+        dtype = _check_dtype(dtype)
 
+    x_data = data[x].to_numpy()
+    y_data = data[y].to_numpy()
     if hmin:
         pix_size = np.sqrt((xlim[1] - xlim[0])**2 + (ylim[1] - ylim[0])**2) / pixels
         h_data = np.maximum(data[data.hcol].to_numpy(), 0.5 * pix_size)
@@ -625,15 +718,16 @@ def interpolate_2d_line(data: 'SarracenDataFrame',
         h_data = data[data.hcol].to_numpy()
 
     grid = get_backend(backend).\
-           interpolate_2d_cross(data[x].to_numpy(), data[y].to_numpy(), w_data, h_data, kernel.w,
-                                kernel.get_radius(), pixels, xlim[0], xlim[1], ylim[0], ylim[1])
+           interpolate_2d_cross(x_data, y_data, w_data, h_data, kernel.w,
+                                kernel.get_radius(), pixels, xlim[0], xlim[1], ylim[0], ylim[1], dtype, out)
 
     if normalize:
-        w_norm = _get_weight(data, np.array([1] * len(w_data)), dens_weight)
+        w_norm = _get_weight(data, np.ones(len(w_data)), dens_weight)
         norm_grid = get_backend(backend). \
-                    interpolate_2d_cross(data[x].to_numpy(), data[y].to_numpy(), w_norm, h_data,
-                                         kernel.w, kernel.get_radius(), pixels, xlim[0], xlim[1], ylim[0], ylim[1])
-        grid = np.nan_to_num(grid / norm_grid)
+                    interpolate_2d_cross(x_data, y_data, w_norm, h_data,
+                                         kernel.w, kernel.get_radius(), pixels, xlim[0], xlim[1], ylim[0], ylim[1],
+                                         dtype)
+        grid = np.nan_to_num(np.divide(grid, norm_grid, out=grid), copy=False)
 
     return grid
 
@@ -731,15 +825,19 @@ def interpolate_3d_line(data: 'SarracenDataFrame',
     else:
         h_data = data[data.hcol].to_numpy()
 
+    x_data = data[x].to_numpy()
+    y_data = data[y].to_numpy()
+    z_data = data[z].to_numpy()
+
     grid = get_backend(backend) \
-           .interpolate_3d_line(data[x].to_numpy(), data[y].to_numpy(), data[z].to_numpy(), w_data, h_data,
+           .interpolate_3d_line(x_data, y_data, z_data, w_data, h_data,
                                 kernel.w, kernel.get_radius(), pixels, xlim[0], xlim[1], ylim[0], ylim[1], zlim[0],
                                 zlim[1])
 
     if normalize:
-        w_norm = _get_weight(data, np.array([1] * len(w_data)), dens_weight)
+        w_norm = _get_weight(data, np.ones(len(w_data)), dens_weight)
         norm_grid = get_backend(backend) \
-                    .interpolate_3d_line(data[x].to_numpy(), data[y].to_numpy(), data[z].to_numpy(), w_norm,
+                    .interpolate_3d_line(x_data, y_data, z_data, w_norm,
                                          h_data, kernel.w, kernel.get_radius(), pixels, xlim[0], xlim[1],
                                          ylim[0], ylim[1], zlim[0], zlim[1])
         grid = np.nan_to_num(grid / norm_grid)
@@ -857,7 +955,7 @@ def interpolate_3d_proj(data: 'SarracenDataFrame',
                                   kernel.get_radius(), x_pixels, y_pixels, xlim[0], xlim[1], ylim[0], ylim[1], exact)
 
     if normalize:
-        w_norm = _get_weight(data, np.array([1] * len(w_data)), dens_weight)
+        w_norm = _get_weight(data, np.ones(len(w_data)), dens_weight)
         norm_grid = get_backend(backend) \
                     .interpolate_3d_projection(x_data, y_data, z_data, w_norm, h_data, weight_function,
                                               kernel.get_radius(), x_pixels, y_pixels, xlim[0], xlim[1], ylim[0],
@@ -977,8 +1075,8 @@ def interpolate_3d_vec(data: 'SarracenDataFrame',
                                                   weight_function, kernel.get_radius(), x_pixels, y_pixels, xlim[0],
                                                   xlim[1], ylim[0], ylim[1], exact)
     if normalize:
-        wx_norm = _get_weight(data, np.array([1] * len(wx_data)), dens_weight)
-        wy_norm = _get_weight(data, np.array([1] * len(wy_data)), dens_weight)
+        wx_norm = _get_weight(data, np.ones(len(wx_data)), dens_weight)
+        wy_norm = _get_weight(data, np.ones(len(wy_data)), dens_weight)
         norm_gridx, norm_gridy = get_backend(backend) \
                     .interpolate_3d_projection_vec(x_data, y_data, wx_norm, wy_norm, h_data,
                                                   weight_function, kernel.get_radius(), x_pixels, y_pixels, xlim[0],
@@ -1095,7 +1193,7 @@ def interpolate_3d_cross(data: 'SarracenDataFrame',
                               kernel.get_radius(), x_pixels, y_pixels, xlim[0], xlim[1], ylim[0], ylim[1])
 
     if normalize:
-        w_norm = _get_weight(data, np.array([1] * len(w_data)), dens_weight)
+        w_norm = _get_weight(data, np.ones(len(w_data)), dens_weight)
         norm_grid = get_backend(backend) \
                     .interpolate_3d_cross(x_data, y_data, z_data, z_slice, w_norm, h_data, kernel.w,
                                           kernel.get_radius(), x_pixels, y_pixels, xlim[0], xlim[1], ylim[0], ylim[1])
@@ -1212,8 +1310,8 @@ def interpolate_3d_cross_vec(data: 'SarracenDataFrame',
                                              ylim[0], ylim[1])
 
     if normalize:
-        wx_norm = _get_weight(data, np.array([1] * len(wx_data)), dens_weight)
-        wy_norm = _get_weight(data, np.array([1] * len(wy_data)), dens_weight)
+        wx_norm = _get_weight(data, np.ones(len(wx_data)), dens_weight)
+        wy_norm = _get_weight(data, np.ones(len(wy_data)), dens_weight)
         norm_gridx, norm_gridy = get_backend(backend) \
                                  .interpolate_3d_cross_vec(x_data, y_data, z_data, z_slice, wx_norm, wy_norm,
                                                            h_data, kernel.w, kernel.get_radius(),
@@ -1332,7 +1430,7 @@ def interpolate_3d_grid(data: 'SarracenDataFrame',
                                 x_pixels, y_pixels, z_pixels, xlim[0], xlim[1], ylim[0], ylim[1], zlim[0], zlim[1])
 
     if normalize:
-        w_norm = _get_weight(data, np.array([1] * len(w_data)), dens_weight)
+        w_norm = _get_weight(data, np.ones(len(w_data)), dens_weight)
         norm_grid = get_backend(backend) \
                     .interpolate_3d_grid(x_data, y_data, z_data, w_norm, h_data, kernel.w,
                                          kernel.get_radius(), x_pixels, y_pixels, z_pixels, xlim[0], xlim[1],
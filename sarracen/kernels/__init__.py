@@ -2,3 +2,4 @@ from ..kernels.base_kernel import BaseKernel
 from ..kernels.cubic_spline import CubicSplineKernel
 from ..kernels.quartic_spline import QuarticSplineKernel
 from ..kernels.quintic_spline import QuinticSplineKernel
+from ..kernels.tabulated import TabulatedKernel
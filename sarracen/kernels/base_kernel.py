@@ -92,6 +92,11 @@ class BaseKernel:
             t = wab_index - index
             return column_kernel[index] * (1 - t) + column_kernel[index1] * t
 
+        # reusing the same function object lets interpolation kernels which take it as an argument
+        # reuse their compiled code, rather than being recompiled for every new function.
+        if samples == 1000:
+            self._ckernel_func_cache = func
+
         return func
 
     # Internal function for performing the integral in _get_column_kernel()
@@ -0,0 +1,61 @@
+import numpy as np
+from numba import njit
+
+from ..kernels import BaseKernel
+
+
+class TabulatedKernel(BaseKernel):
+    """A lookup table approximation of another kernel.
+
+    The weights of the underlying kernel are tabulated once, in 1, 2 and 3 dimensions, at `samples`
+    evenly spaced values of q. Evaluating this kernel then only requires a linear interpolation
+    between two table entries, rather than a full evaluation of the kernel's piecewise polynomial.
+
+    Parameters
+    ----------
+    kernel: BaseKernel
+        The kernel to approximate.
+    samples: int
+        Number of sample points in the lookup table. Must be at least 2.
+
+    Raises
+    ------
+    ValueError
+        If `samples` is less than 2.
+    """
+
+    def __init__(self, kernel: BaseKernel, samples: int = 4096):
+        if samples < 2:
+            raise ValueError("`samples` must be at least 2!")
+        super().__init__()
+        self.kernel = kernel
+        self.samples = samples
+        self.w = TabulatedKernel._table_func(kernel.w, kernel.get_radius(), samples)
+
+    def get_radius(self) -> float:
+        return self.kernel.get_radius()
+
+    def get_column_kernel(self, samples: int = 1000) -> np.ndarray:
+        # the column kernel is integrated from the exact kernel, rather than its tabulated approximation.
+        return self.kernel.get_column_kernel(samples)
+
+    # Internal function for creating the numba-accelerated lookup function.
+    @staticmethod
+    def _table_func(wfunc, radius, samples):
+        q = np.linspace(0, radius, samples)
+        table = np.stack((wfunc(q, 1), wfunc(q, 2), wfunc(q, 3)))
+        scale = (samples - 1) / radius
+
+        @njit(fastmath=True)
+        def func(q, dim):
+            if q < 0 or q >= radius:
+                return 0.0
+
+            # table values are evenly spaced in q, so the lower index is found directly. q just below the
+            # radius may round up to the last sample, so the index is clamped to keep index + 1 in the table.
+            wab_index = q * scale
+            index = min(int(wab_index), samples - 2)
+            t = wab_index - index
+            return table[dim - 1, index] * (1 - t) + table[dim - 1, index + 1] * t
+
+        return func
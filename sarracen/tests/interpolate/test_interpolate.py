@@ -1188,3 +1188,118 @@ def test_minimum_smoothing_length_1d_lines(backend):
 
     assert (grid == grid_hmin).all()
 
+
+@mark.parametrize("backend", backends)
+def test_output_dtype(backend):
+    """ Test that a narrower output type gives the same result, to within its precision. """
+    sdf = SarracenDataFrame({'x': [0.3, -0.1, 0.1, 0.1], 'y': [0.0, 0.1, -0.1, 0.0], 'A': [2, 1.5, 3, 0.5],
+                             'h': [0.4, 0.3, 0.5, 0.2], 'rho': [0.1, 0.2, 0.1, 0.3], 'm': [1, 1, 1, 1]},
+                            params=dict())
+    sdf.backend = backend
+
+    for exact in [False, True]:
+        image = interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=20, exact=exact, normalize=False)
+        image_32 = interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=20, exact=exact, normalize=False,
+                                  dtype=np.float32)
+
+        assert image.dtype == np.float64
+        assert image_32.dtype == np.float32
+        assert_allclose(image_32, image, rtol=1e-5, atol=1e-6)
+
+    line = interpolate_2d_line(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), pixels=20, normalize=False)
+    line_32 = interpolate_2d_line(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), pixels=20, normalize=False,
+                                  dtype=np.float32)
+
+    assert line.dtype == np.float64
+    assert line_32.dtype == np.float32
+    assert_allclose(line_32, line, rtol=1e-5, atol=1e-6)
+
+    # equivalent forms of a supported type are accepted.
+    image_32 = interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=20, normalize=False, dtype='float32')
+    assert image_32.dtype == np.float32
+    line_32 = interpolate_2d_line(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), pixels=20, normalize=False,
+                                  dtype=np.dtype(np.float32))
+    assert line_32.dtype == np.float32
+
+    for dtype in [np.float16, np.int64, 'int32']:
+        with raises(ValueError):
+            interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=20, dtype=dtype)
+        with raises(ValueError):
+            interpolate_2d_line(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), pixels=20, dtype=dtype)
+
+    # the type of a preallocated output takes the place of `dtype`.
+    image_32 = interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=20, normalize=False, dtype=np.float16,
+                              out=np.zeros((20, 20), dtype=np.float32))
+    assert image_32.dtype == np.float32
+    line_32 = interpolate_2d_line(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), pixels=20, normalize=False, dtype=np.float16,
+                                  out=np.zeros(20, dtype=np.float32))
+    assert line_32.dtype == np.float32
+
+
+@mark.parametrize("backend", backends)
+def test_output_buffer(backend):
+    """ Test that results written to a preallocated output array match newly allocated results. """
+    sdf = SarracenDataFrame({'x': [0.3, -0.1, 0.1, 0.1], 'y': [0.0, 0.1, -0.1, 0.0], 'A': [2, 1.5, 3, 0.5],
+                             'h': [0.4, 0.3, 0.5, 0.2], 'rho': [0.1, 0.2, 0.1, 0.3], 'm': [1, 1, 1, 1]},
+                            params=dict())
+    sdf.backend = backend
+
+    for exact in [False, True]:
+        for normalize in [False, True]:
+            image = interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=20, exact=exact,
+                                   normalize=normalize)
+
+            # stale values in the buffer should be overwritten.
+            out = np.full((20, 20), 5.0)
+            result = interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=20, exact=exact,
+                                    normalize=normalize, out=out)
+
+            assert result is out
+            assert_allclose(out, image)
+
+    line = interpolate_2d_line(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), pixels=20)
+    out = np.full(20, 5.0)
+    result = interpolate_2d_line(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), pixels=20, out=out)
+
+    assert result is out
+    assert_allclose(out, line)
+
+    with raises(ValueError):
+        interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=20, out=np.zeros((20, 21)))
+    with raises(ValueError):
+        interpolate_2d_line(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), pixels=20, out=np.zeros(21))
+
+    # integer output would be truncated, so it is rejected.
+    with raises(ValueError):
+        interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=20, out=np.zeros((20, 20), dtype=np.int64))
+    with raises(ValueError):
+        interpolate_2d_line(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), pixels=20, out=np.zeros(20, dtype=np.int32))
+
+
+@mark.parametrize("backend", backends)
+def test_large_image(backend):
+    """
+    Interpolation to an image spanning many tiles, with particles clustered in one corner, should match a
+    direct summation over every particle and pixel.
+    """
+    rng = np.random.default_rng(5)
+    n = 300
+    sdf = SarracenDataFrame({'x': np.concatenate([rng.uniform(-1, 1, n // 2), rng.uniform(-1, -0.8, n // 2)]),
+                             'y': np.concatenate([rng.uniform(-1, 1, n // 2), rng.uniform(-1, -0.8, n // 2)]),
+                             'A': rng.uniform(0, 2, n), 'h': rng.uniform(0.01, 0.3, n),
+                             'rho': rng.uniform(0.5, 1, n), 'm': np.ones(n)}, params=dict())
+    kernel = CubicSplineKernel()
+    sdf.kernel = kernel
+    sdf.backend = backend
+
+    image = interpolate_2d(sdf, 'A', xlim=(-1, 1), ylim=(-1, 1), x_pixels=301, y_pixels=257, normalize=False)
+
+    x = -1 + (np.arange(301) + 0.5) * (2 / 301)
+    y = -1 + (np.arange(257) + 0.5) * (2 / 257)
+    expected = np.zeros((257, 301))
+    for i in range(n):
+        h = sdf['h'][i]
+        q = np.sqrt((x[np.newaxis, :] - sdf['x'][i]) ** 2 + (y[:, np.newaxis] - sdf['y'][i]) ** 2) / h
+        expected += sdf['m'][i] / (sdf['rho'][i] * h ** 2) * sdf['A'][i] * kernel.w(q, 2)
+
+    assert_allclose(image, expected, rtol=1e-10, atol=1e-10)
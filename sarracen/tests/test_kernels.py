@@ -1,9 +1,9 @@
 """pytest unit tests for kernel functionality."""
-from pytest import approx, mark
+from pytest import approx, mark, raises
 from scipy.integrate import quad, dblquad, tplquad
 import numpy as np
 
-from sarracen.kernels import CubicSplineKernel, QuarticSplineKernel, QuinticSplineKernel
+from sarracen.kernels import CubicSplineKernel, QuarticSplineKernel, QuinticSplineKernel, TabulatedKernel
 
 
 def single_kernel(x, kernel):
@@ -174,3 +174,42 @@ def test_oob(kernel):
     column_func = kernel.get_column_kernel_func(1000)
     assert column_func(-1, 0) == column_func(0, 0)
     assert approx(column_func(kernel.get_radius() + 1, 0)) == 0
+
+
+@mark.parametrize("kernel",
+                  [CubicSplineKernel(), QuarticSplineKernel(), QuinticSplineKernel()])
+def test_tabulated(kernel):
+    tabulated = TabulatedKernel(kernel)
+    assert tabulated.get_radius() == kernel.get_radius()
+
+    for dimensions in range(1, 4):
+        for q in np.linspace(0, kernel.get_radius(), 50):
+            assert tabulated.w(q, dimensions) == approx(kernel.w(q, dimensions), abs=1e-6)
+
+        assert tabulated.w(-1, dimensions) == 0
+        assert tabulated.w(kernel.get_radius() + 1, dimensions) == 0
+
+    # at least two samples are needed to interpolate between table entries.
+    for samples in [-1, 0, 1]:
+        with raises(ValueError):
+            TabulatedKernel(kernel, samples)
+
+
+@mark.parametrize("kernel",
+                  [CubicSplineKernel(), QuarticSplineKernel(), QuinticSplineKernel()])
+@mark.parametrize("samples", [18, 131, 1000])
+def test_tabulated_edge(kernel, samples):
+    # the largest q within the kernel can round up to the last table index.
+    tabulated = TabulatedKernel(kernel, samples)
+    q = np.nextafter(kernel.get_radius(), 0)
+
+    for dimensions in range(1, 4):
+        assert tabulated.w(q, dimensions) == approx(kernel.w(q, dimensions), abs=1e-6)
+
+
+@mark.parametrize("kernel",
+                  [CubicSplineKernel(), QuarticSplineKernel(), QuinticSplineKernel()])
+def test_column_func_cache(kernel):
+    # the default column kernel function is reused, so that kernels taking it as an argument are only compiled once.
+    assert kernel.get_column_kernel_func(1000) is kernel.get_column_kernel_func(1000)
+    assert kernel.get_column_kernel_func(500) is not kernel.get_column_kernel_func(1000)